@@ -10,7 +10,9 @@
 #
 # All configuration values have a default; values that are commented out
 # serve to show the default.
+import os
 import pathlib
+import re
 import sys
 
 # If extensions (or modules to document with autodoc) are in another directory,
@@ -23,6 +25,8 @@ ABOUT_FILE = TOPLEVEL_DIR / "tfs" / "__init__.py"
 if str(TOPLEVEL_DIR) not in sys.path:
     sys.path.insert(0, str(TOPLEVEL_DIR))
 
+DUNDER_REGEX = re.compile(r'^(__\w+__)\s*=\s*"([^"]*)"', re.MULTILINE)
+
 
 def about_package(init_posixpath: pathlib.Path) -> dict:
     """
@@ -30,11 +34,7 @@ def about_package(init_posixpath: pathlib.Path) -> dict:
     provided with a PosixPath to the __init__.py file.
     """
     about_text: str = init_posixpath.read_text()
-    return {
-        entry.split(" = ")[0]: entry.split(" = ")[1].strip('"')
-        for entry in about_text.strip().split("\n")
-        if entry.startswith("__")
-    }
+    return dict(DUNDER_REGEX.findall(about_text))
 
 
 ABOUT_TFS = about_package(ABOUT_FILE)
@@ -58,12 +58,19 @@ extensions = [
     "sphinx.ext.mathjax",  # Render math via JavaScript
     "sphinx.ext.napoleon",  # Support for NumPy and Google style docstrings
     "sphinx.ext.todo",  # Support for todo items
-    "sphinx.ext.viewcode",  # Add links to highlighted source code
     "sphinx_copybutton",  # Add a "copy" button to code blocks
     "sphinx-prompt",  # prompt symbols will not be copy-pastable
-    "sphinx_codeautolink",  # Automatically link example code to documentation source
 ]
 
+# The following extensions go through the whole source tree on every build and
+# dominate the time of incremental builds. They are always used on CI and ReadTheDocs,
+# and locally only on request: 'make html' is fast, 'TFS_FULL_DOCS=1 make html' is full
+if any(os.environ.get(variable) for variable in ("TFS_FULL_DOCS", "CI", "READTHEDOCS")):
+    extensions += [
+        "sphinx.ext.viewcode",  # Add links to highlighted source code
+        "sphinx_codeautolink",  # Automatically link example code to documentation source
+    ]
+
 # Config for autosectionlabel extension
 autosectionlabel_prefix_document = True  # Make sure the target is unique
 autosectionlabel_maxdepth = 2
@@ -237,11 +244,20 @@ texinfo_documents = [
 # Example configuration for intersphinx: refer to the Python standard library.
 # use in refs e.g:
 # :ref:`comparison manual <python:comparisons>`
+# Each inventory is first looked for locally in the '_inv' directory (which can be
+# populated with 'make refresh-inv') and only fetched from the network if absent.
+# The '_inv' directory is not version-controlled: once downloaded, the local files
+# shadow the remote inventories until they are deleted or refreshed again
+INVENTORIES_DIR = "_inv"
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3/", None),
-    "numpy": ("https://numpy.org/doc/stable/", None),
-    "pandas": ("https://pandas.pydata.org/pandas-docs/stable/", None),
-    "matplotlib": ("https://matplotlib.org/stable/", None),
-    "scipy": ("https://docs.scipy.org/doc/scipy/", None),
-    "cpymad": ("https://hibtc.github.io/cpymad/", None),
+    "python": ("https://docs.python.org/3/", (f"{INVENTORIES_DIR}/python.inv", None)),
+    "numpy": ("https://numpy.org/doc/stable/", (f"{INVENTORIES_DIR}/numpy.inv", None)),
+    "pandas": ("https://pandas.pydata.org/pandas-docs/stable/", (f"{INVENTORIES_DIR}/pandas.inv", None)),
+    "matplotlib": ("https://matplotlib.org/stable/", (f"{INVENTORIES_DIR}/matplotlib.inv", None)),
+    "scipy": ("https://docs.scipy.org/doc/scipy/", (f"{INVENTORIES_DIR}/scipy.inv", None)),
+    "cpymad": ("https://hibtc.github.io/cpymad/", (f"{INVENTORIES_DIR}/cpymad.inv", None)),
 }
+
+# Keep downloaded inventories for this many days so that incremental
+# builds (e.g. with a cached doctrees directory) do not refetch them
+intersphinx_cache_limit = 90
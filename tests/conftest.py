@@ -4,102 +4,154 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from tfs import TfsDataFrame
+from tfs import TfsDataFrame, read_tfs
 
 INPUTS_DIR = pathlib.Path(__file__).parent / "inputs"
+RNG_SEED: int = 2077  # fixed seed so the random data in fixtures is reproducible
 
 
 # ----- Fixtures ----- #
 
+# Paths are immutable so these can be shared by the whole session
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def _tfs_filex() -> pathlib.Path:
     return INPUTS_DIR / "file_x.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_filey() -> pathlib.Path:
     return INPUTS_DIR / "file_y.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_booleans_file() -> pathlib.Path:
     """A TFS file with BOOL in headers and in a column."""
     return INPUTS_DIR / "booleans.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_complex_file() -> pathlib.Path:
     """A TFS file with complex values in headers and in a column."""
     return INPUTS_DIR / "complex.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_madng_file() -> pathlib.Path:
     """A TFS file withboth complex values and booleans, in headers and columns."""
     return INPUTS_DIR / "madng.tfs"
 
 
+# The parsed files below are shared by the whole session, so
+# they are only read once and tests must not modify them
+
+
+@pytest.fixture(scope="session")
+def _dframe_x(_tfs_filex) -> TfsDataFrame:
+    return read_tfs(_tfs_filex)
+
+
+@pytest.fixture(scope="session")
+def _dframe_y(_tfs_filey) -> TfsDataFrame:
+    return read_tfs(_tfs_filey)
+
+
 # The below return (Tfs)DataFrames for the write tests
 # as we start with writing, and don't want to start by
-# reading the files from disk.
+# reading the files from disk. They are built once per
+# session (with a seeded RNG) and each test is given its
+# own copy, as many tests modify the dataframe or headers.
+
+
+@pytest.fixture
+def _pd_dataframe(_session_pd_dataframe) -> pd.DataFrame:
+    return _session_pd_dataframe.copy()
+
+
+@pytest.fixture
+def _tfs_dataframe(_session_tfs_dataframe) -> TfsDataFrame:
+    return _copy_tfs_dataframe(_session_tfs_dataframe)
+
+
+@pytest.fixture
+def _tfs_dataframe_booleans(_session_tfs_dataframe_booleans) -> TfsDataFrame:
+    """TfsDataFrame with boolean values in the headers and data (1 column)."""
+    return _copy_tfs_dataframe(_session_tfs_dataframe_booleans)
+
+
+@pytest.fixture
+def _tfs_dataframe_complex(_session_tfs_dataframe_complex) -> TfsDataFrame:
+    """TfsDataFrame with complex values in the headers and data (1 column)."""
+    return _copy_tfs_dataframe(_session_tfs_dataframe_complex)
 
 
 @pytest.fixture
-def _pd_dataframe() -> pd.DataFrame:
+def _tfs_dataframe_madng(_session_tfs_dataframe_madng) -> TfsDataFrame:
+    """
+    TfsDataFrame with both booleans and complex
+    values in the headers and data (1 column each).
+    """
+    return _copy_tfs_dataframe(_session_tfs_dataframe_madng)
+
+
+# ----- Session Fixtures ----- #
+
+
+@pytest.fixture(scope="session")
+def _session_pd_dataframe() -> pd.DataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     return pd.DataFrame(
         index=range(3),
         columns="a b c d e".split(),
-        data=np.random.rand(3, 5),
+        data=rng.random((3, 5)),
     )
 
 
-@pytest.fixture
-def _tfs_dataframe() -> TfsDataFrame:
+@pytest.fixture(scope="session")
+def _session_tfs_dataframe() -> TfsDataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     return TfsDataFrame(
         index=range(15),
         columns="a b c d e".split(),
-        data=np.random.rand(15, 5),
+        data=rng.random((15, 5)),
         headers={"Title": "Tfs Title", "Value": 3.3663},
     )
 
 
-@pytest.fixture
-def _tfs_dataframe_booleans() -> TfsDataFrame:
-    """TfsDataFrame with boolean values in the headers and data (1 column)."""
+@pytest.fixture(scope="session")
+def _session_tfs_dataframe_booleans() -> TfsDataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     df = TfsDataFrame(
         index=range(15),
         columns="a b c d e".split(),
-        data=np.random.rand(15, 5),
+        data=rng.random((15, 5)),
         headers={"Title": "Bool Test", "Bool1": True, "Bool2": False, "Bool3": 1},
     )
-    df["bools"] = np.random.rand(15) > 0.5  # random from 0 to 1 and then boolean check
+    df["bools"] = rng.random(15) > 0.5  # random from 0 to 1 and then boolean check
     return df
 
 
-@pytest.fixture
-def _tfs_dataframe_complex() -> TfsDataFrame:
-    """TfsDataFrame with complex values in the headers and data (1 column)."""
+@pytest.fixture(scope="session")
+def _session_tfs_dataframe_complex() -> TfsDataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     df = TfsDataFrame(
         index=range(15),
         columns="a b c d e".split(),
-        data=np.random.rand(15, 5),
+        data=rng.random((15, 5)),
         headers={"Title": "Complex Test", "Complex1": 1 + 2j, "Complex2": -4 - 17.9j},
     )
-    df["complex"] = np.random.rand(15) + np.random.rand(15) * 1j
+    df["complex"] = rng.random(15) + rng.random(15) * 1j
     return df
 
 
-@pytest.fixture
-def _tfs_dataframe_madng() -> TfsDataFrame:
-    """
-    TfsDataFrame with both booleans and complex
-    values in the headers and data (1 column each).
-    """
+@pytest.fixture(scope="session")
+def _session_tfs_dataframe_madng() -> TfsDataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     df = TfsDataFrame(
         index=range(15),
         columns="a b c d e".split(),
-        data=np.random.rand(15, 5),
+        data=rng.random((15, 5)),
         headers={
             "Title": "MADNG Test",
             "Bool1": True,
@@ -109,6 +161,16 @@ def _tfs_dataframe_madng() -> TfsDataFrame:
             "Complex2": -94.6 - 67.9j,
         },
     )
-    df["bools"] = np.random.rand(15) > 0.5  # random from 0 to 1 and then boolean check
-    df["complex"] = np.random.rand(15) + np.random.rand(15) * 1j
+    df["bools"] = rng.random(15) > 0.5  # random from 0 to 1 and then boolean check
+    df["complex"] = rng.random(15) + rng.random(15) * 1j
     return df
+
+
+# ----- Helpers ----- #
+
+
+def _copy_tfs_dataframe(df: TfsDataFrame) -> TfsDataFrame:
+    """Copy of the dataframe with its own headers dict (pandas would share the same one)."""
+    new = df.copy()
+    new.headers = dict(df.headers)
+    return new
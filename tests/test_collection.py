@@ -1,4 +1,6 @@
+import os
 import pathlib
+import shutil
 
 import pytest
 
@@ -7,7 +9,7 @@ from tfs.collection import Tfs, TfsCollection
 from tfs.frame import TfsDataFrame
 from tfs.testing import assert_tfs_frame_equal
 
-from .conftest import INPUTS_DIR
+from .conftest import INPUTS_DIR, _copy_tfs_dataframe
 
 
 class CollectionTest(TfsCollection):
@@ -188,15 +190,33 @@ class TestFilenames:
         assert c.filenames()["file_x"] == "file_x.tfs"
         assert c.filenames()["nofile_y"] == "nofile_y.tfs"
 
-        assert all(f in c.filenames() for f in exist_properties)
-        assert all(f in c.filenames() for f in not_exist_properties)
-        assert all(f in c.filenames().values() for f in exist_files)
-        assert all(f in c.filenames().values() for f in not_exist_files)
+        all_filenames = c.filenames()
+        assert all(f in all_filenames for f in exist_properties)
+        assert all(f in all_filenames for f in not_exist_properties)
+        assert all(f in all_filenames.values() for f in exist_files)
+        assert all(f in all_filenames.values() for f in not_exist_files)
 
-        assert all(f in c.filenames(exist=True) for f in exist_properties)
-        assert all(f not in c.filenames(exist=True) for f in not_exist_properties)
-        assert all(f in c.filenames(exist=True).values() for f in exist_files)
-        assert all(f not in c.filenames(exist=True).values() for f in not_exist_files)
+        existing_filenames = c.filenames(exist=True)  # checks every file on disk, do it only once
+        assert all(f in existing_filenames for f in exist_properties)
+        assert all(f not in existing_filenames for f in not_exist_properties)
+        assert all(f in existing_filenames.values() for f in exist_files)
+        assert all(f not in existing_filenames.values() for f in not_exist_files)
+
+    def test_filenames_exist_relative_paths(self, _input_dir_pathlib: pathlib.Path):
+        class SubdirCollectionTest(TfsCollection):
+            compressed = Tfs("compressed/file_x.tfs.gz", two_planes=False)
+            nofile = Tfs("compressed/nofile_x.tfs.gz", two_planes=False)
+            dot = Tfs("./file_x.tfs", two_planes=False)
+
+            def _get_filename(self, template):
+                return template
+
+        c = SubdirCollectionTest(_input_dir_pathlib)
+        assert c.filenames(exist=True) == {"compressed": "compressed/file_x.tfs.gz", "dot": "./file_x.tfs"}
+
+    def test_filenames_exist_no_directory(self, tmp_path):
+        c = CollectionTest(tmp_path / "not_there")
+        assert c.filenames(exist=True) == {}
 
     def test_get_path(self, _input_dir_pathlib: pathlib.Path):
         c = CollectionTest(_input_dir_pathlib, allow_write=False)
@@ -255,6 +275,19 @@ class TestOther:
         assert res_file[0] == 9
         assert res_file[1] == 13
 
+    def test_read_sees_changes_on_disk(self, _tfs_filex: pathlib.Path, tmp_path):
+        tfs_file = tmp_path / "file_x.tfs"
+        shutil.copy2(_tfs_filex, tfs_file)
+        assert CollectionTest(tmp_path).file_x.headers["TITLE"] == "Title of your tfs file"
+
+        # Same-size change with the modification time restored, like 'cp -p' or 'rsync -t' would do
+        stat = tfs_file.stat()
+        tfs_file.write_text(tfs_file.read_text().replace("your", "YOUR", 1))
+        os.utime(tfs_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert tfs_file.stat().st_size == stat.st_size
+
+        assert CollectionTest(tmp_path).file_x.headers["TITLE"] == "Title of YOUR tfs file"
+
     def test_buffer_clear(self, _dummy_collection):
         _dummy_collection._buffer["some_key"] = 5  # noqa: SLF001
         assert _dummy_collection._buffer["some_key"]  # noqa: SLF001
@@ -274,22 +307,36 @@ def _read_tfs(path):
     return read_tfs(path).set_index("NAME", drop=False)
 
 
+# The files are parsed once per session, and each test is
+# given its own copy as some of them modify the dataframes
+
+
 @pytest.fixture
-def _tfs_x(_tfs_filex) -> TfsDataFrame:
-    return _read_tfs(_tfs_filex)
+def _tfs_x(_session_tfs_x) -> TfsDataFrame:
+    return _copy_tfs_dataframe(_session_tfs_x)
 
 
 @pytest.fixture
-def _tfs_y(_tfs_filey) -> TfsDataFrame:
+def _tfs_y(_session_tfs_y) -> TfsDataFrame:
+    return _copy_tfs_dataframe(_session_tfs_y)
+
+
+@pytest.fixture(scope="session")
+def _session_tfs_x(_tfs_filex) -> TfsDataFrame:
+    return _read_tfs(_tfs_filex)
+
+
+@pytest.fixture(scope="session")
+def _session_tfs_y(_tfs_filey) -> TfsDataFrame:
     return _read_tfs(_tfs_filey)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _input_dir_pathlib() -> pathlib.Path:
     return INPUTS_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _input_dir_str() -> str:
     return str(INPUTS_DIR)
 
@@ -6,6 +6,7 @@ import pathlib
 
 import pytest
 
+from tfs.frame import TfsDataFrame
 from tfs.reader import read_headers, read_tfs
 from tfs.testing import assert_tfs_frame_equal
 from tfs.writer import write_tfs
@@ -18,9 +19,9 @@ SUPPORTED_EXTENSIONS: tuple[str] = ["gz", "bz2", "zip", "xz", "zst", "tar", "tar
 
 
 @pytest.mark.parametrize("extension", SUPPORTED_EXTENSIONS)
-def test_read_compressed_is_same_data(_tfs_filex, _tfs_compressed_filex_no_suffix, extension):
+def test_read_compressed_is_same_data(_ref_df_filex, _tfs_compressed_filex_no_suffix, extension):
     """Compare the data from a compressed file with the original one."""
-    ref_df = read_tfs(_tfs_filex, index="NAME")
+    ref_df = _ref_df_filex
 
     # Now read the compressed version, for a given extension in the parametrize
     compressed_file = _path_with_added_extension(_tfs_compressed_filex_no_suffix, extension)
@@ -31,12 +32,12 @@ def test_read_compressed_is_same_data(_tfs_filex, _tfs_compressed_filex_no_suffi
 
 
 @pytest.mark.parametrize("extension", SUPPORTED_EXTENSIONS)
-def test_write_read_compressed(_tfs_filey, tmp_path, extension):
+def test_write_read_compressed(_tfs_filey, _ref_df_filey, _compressed_outputs_dir, extension):
     """Ensure that writing in compressed format preserves data."""
-    ref_df = read_tfs(_tfs_filey, index="NAME")
+    ref_df = _ref_df_filey
 
     # Now we write it in compressed form and check it's doing fine
-    compressed_path = tmp_path.with_suffix(f".{extension}")
+    compressed_path = _compressed_outputs_dir / f"file_y.tfs.{extension}"
     write_tfs(compressed_path, ref_df, save_index="NAME")
     assert compressed_path.exists()
     assert compressed_path.stat().st_size > 0
@@ -55,16 +56,16 @@ def test_read_headers_compressed(_tfs_compressed_filex_no_suffix, extension):
     assert isinstance(headers, dict)
     assert len(headers) > 0
     assert len(str(headers)) > 0
-    assert all(key in headers for key in ["TITLE", "DPP", "Q1", "Q1RMS", "NATQ1", "NATQ1RMS", "BPMCOUNT"])
+    assert {"TITLE", "DPP", "Q1", "Q1RMS", "NATQ1", "NATQ1RMS", "BPMCOUNT"} <= headers.keys()
 
 
 # ----- Compression tests with TFS files including MAD-NG features ----- #
 
 
 @pytest.mark.parametrize("extension", SUPPORTED_EXTENSIONS)
-def test_read_madng_compressed_is_same_data(_tfs_madng_file, _tfs_compressed_madng_no_suffix, extension):
+def test_read_madng_compressed_is_same_data(_ref_df_madng, _tfs_compressed_madng_no_suffix, extension):
     """Compare the data from a compressed file with the original one."""
-    ref_df = read_tfs(_tfs_madng_file, index="NAME")
+    ref_df = _ref_df_madng
 
     # Now read the compressed version, for a given extension in the parametrize
     compressed_file = _path_with_added_extension(_tfs_compressed_madng_no_suffix, extension)
@@ -75,12 +76,12 @@ def test_read_madng_compressed_is_same_data(_tfs_madng_file, _tfs_compressed_mad
 
 
 @pytest.mark.parametrize("extension", SUPPORTED_EXTENSIONS)
-def test_write_read_madng_compressed(_tfs_madng_file, tmp_path, extension):
+def test_write_read_madng_compressed(_tfs_madng_file, _ref_df_madng, _compressed_outputs_dir, extension):
     """Ensure that writing in compressed format preserves data."""
-    ref_df = read_tfs(_tfs_madng_file, index="NAME")
+    ref_df = _ref_df_madng
 
     # Now we write it in compressed form and check it's doing fine
-    compressed_path = tmp_path.with_suffix(f".{extension}")
+    compressed_path = _compressed_outputs_dir / f"madng.tfs.{extension}"
     write_tfs(compressed_path, ref_df, save_index="NAME", validate="madng")
     assert compressed_path.exists()
     assert compressed_path.stat().st_size > 0
@@ -99,21 +100,18 @@ def test_read_headers_madng_compressed(_tfs_compressed_madng_no_suffix, extensio
     assert isinstance(headers, dict)
     assert len(headers) > 0
     assert len(str(headers)) > 0
-    assert all(
-        key in headers
-        for key in [
-            "TITLE",
-            "DPP",
-            "Q1",
-            "Q1RMS",
-            "NATQ1",
-            "NATQ1RMS",
-            "BPMCOUNT",
-            "BOOLEAN1",
-            "BOOLEAN2",
-            "COMPLEX",
-        ]
-    )
+    assert {
+        "TITLE",
+        "DPP",
+        "Q1",
+        "Q1RMS",
+        "NATQ1",
+        "NATQ1RMS",
+        "BPMCOUNT",
+        "BOOLEAN1",
+        "BOOLEAN2",
+        "COMPLEX",
+    } <= headers.keys()
 
 
 # ----- Helpers & Fixtures ------ #
@@ -124,13 +122,38 @@ def _path_with_added_extension(path: pathlib.Path, extension: str) -> pathlib.Pa
     return path.with_suffix(path.suffix + f".{extension}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_compressed_filex_no_suffix() -> pathlib.Path:
     """Add the wanted compression suffix to this."""
     return INPUTS_DIR / "compressed" / "file_x.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_compressed_madng_no_suffix() -> pathlib.Path:
     """Add the wanted compression suffix to this."""
     return INPUTS_DIR / "compressed" / "madng.tfs"
+
+
+@pytest.fixture(scope="module")
+def _compressed_outputs_dir(tmp_path_factory) -> pathlib.Path:
+    """A single directory for all written compressed files, each test writes a different file."""
+    return tmp_path_factory.mktemp("compressed_outputs")
+
+
+# The reference dataframes below are parsed only once and shared by all tests
+# (and extensions) of the session: they are only read from, never modified.
+
+
+@pytest.fixture(scope="session")
+def _ref_df_filex(_tfs_filex) -> TfsDataFrame:
+    return read_tfs(_tfs_filex, index="NAME")
+
+
+@pytest.fixture(scope="session")
+def _ref_df_filey(_tfs_filey) -> TfsDataFrame:
+    return read_tfs(_tfs_filey, index="NAME")
+
+
+@pytest.fixture(scope="session")
+def _ref_df_madng(_tfs_madng_file) -> TfsDataFrame:
+    return read_tfs(_tfs_madng_file, index="NAME")
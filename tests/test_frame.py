@@ -1,4 +1,6 @@
-from functools import partial, reduce
+from collections.abc import Callable
+from functools import cache, partial, reduce
+from types import MappingProxyType
 
 import pandas as pd
 import pytest
@@ -31,72 +33,106 @@ class TestFailures:
 
 
 class TestTfsDataFrameMerging:
+    # Headers merging does not depend on the data merging, so we check
+    # each with its own parametrization instead of their full product
+
     @pytest.mark.parametrize("how_headers", [None, "left", "right"])
-    @pytest.mark.parametrize("how", ["left", "right", "outer", "inner"])
-    @pytest.mark.parametrize("on", ["NAME", "S", "NUMBER", "CO", "CORMS", "BPM_RES"])
-    def test_correct_merging(self, _tfs_filex, _tfs_filey, how_headers, how, on):
-        dframe_x = tfs.read(_tfs_filex)
-        dframe_y = tfs.read(_tfs_filey)
-        result = dframe_x.merge(dframe_y, how_headers=how_headers, how=how, on=on)
+    def test_correct_headers_merging(self, _dframe_x, _dframe_y, how_headers):
+        dframe_x = _dframe_x
+        dframe_y = _dframe_y
+        result = dframe_x.merge(dframe_y, how_headers=how_headers, how="inner", on="NAME")
 
         assert isinstance(result, TfsDataFrame)
         assert isinstance(result.headers, dict)
         assert_dict_equal(result.headers, merge_headers(dframe_x.headers, dframe_y.headers, how=how_headers))
-        assert_frame_equal(result, pd.DataFrame(dframe_x).merge(pd.DataFrame(dframe_y), how=how, on=on))
 
-    @pytest.mark.parametrize("how_headers", [None, "left", "right"])
     @pytest.mark.parametrize("how", ["left", "right", "outer", "inner"])
     @pytest.mark.parametrize("on", ["NAME", "S", "NUMBER", "CO", "CORMS", "BPM_RES"])
-    def test_merging_accepts_pandas_dataframe(self, _tfs_filex, _tfs_filey, how_headers, how, on):
-        dframe_x = tfs.read(_tfs_filex)
-        dframe_y = pd.DataFrame(tfs.read(_tfs_filey))  # for test, loses headers here
-        result = dframe_x.merge(dframe_y, how_headers=how_headers, how=how, on=on)
+    def test_correct_merging(self, _dframe_x, _dframe_y, _reference_merge, how, on):
+        dframe_x = _dframe_x
+        dframe_y = _dframe_y
+        result = dframe_x.merge(dframe_y, how=how, on=on)
+
+        assert isinstance(result, TfsDataFrame)
+        assert_frame_equal(result, _reference_merge(how, on))
+
+    @pytest.mark.parametrize("how_headers", [None, "left", "right"])
+    def test_headers_merging_accepts_pandas_dataframe(self, _dframe_x, _pd_dframe_y, how_headers):
+        dframe_x = _dframe_x
+        dframe_y = _pd_dframe_y  # for test, has no headers
+        result = dframe_x.merge(dframe_y, how_headers=how_headers, how="inner", on="NAME")
 
         assert isinstance(result, TfsDataFrame)
         assert isinstance(result.headers, dict)
 
         # using empty dict here as it's what dframe_y is getting when converted in the call
         assert_dict_equal(result.headers, merge_headers(dframe_x.headers, headers_right={}, how=how_headers))
-        assert_frame_equal(result, pd.DataFrame(dframe_x).merge(pd.DataFrame(dframe_y), how=how, on=on))
+
+    @pytest.mark.parametrize("how", ["left", "right", "outer", "inner"])
+    @pytest.mark.parametrize("on", ["NAME", "S", "NUMBER", "CO", "CORMS", "BPM_RES"])
+    def test_merging_accepts_pandas_dataframe(self, _dframe_x, _pd_dframe_y, _reference_merge, how, on):
+        dframe_x = _dframe_x
+        dframe_y = _pd_dframe_y  # for test, has no headers
+        result = dframe_x.merge(dframe_y, how=how, on=on)
+
+        assert isinstance(result, TfsDataFrame)
+        assert_frame_equal(result, _reference_merge(how, on))
 
 
 class TestHeadersMerging:
-    @pytest.mark.parametrize("how", ["left", "LEFT", "Left", "lEfT"])  # we're case-insensitive
-    def test_headers_merging_left(self, _tfs_filex, _tfs_filey, how):
-        headers_left = tfs.read(_tfs_filex).headers
-        headers_right = tfs.read(_tfs_filey).headers
-        result = merge_headers(headers_left, headers_right, how=how)
+    @pytest.mark.parametrize(
+        ("how", "expected"),
+        [
+            ("left", {"A": 1, "B": 2, "C": 4}),
+            ("LEFT", {"A": 1, "B": 2, "C": 4}),
+            ("Left", {"A": 1, "B": 2, "C": 4}),
+            ("lEfT", {"A": 1, "B": 2, "C": 4}),
+            ("right", {"A": 1, "B": 3, "C": 4}),
+            ("RIGHT", {"A": 1, "B": 3, "C": 4}),
+            ("Right", {"A": 1, "B": 3, "C": 4}),
+            ("RigHt", {"A": 1, "B": 3, "C": 4}),
+            ("none", {}),
+            ("None", {}),
+            ("nOnE", {}),
+        ],
+    )
+    def test_merge_headers_case_insensitive(self, how, expected):
+        # Only checks the 'how' parsing, so in-memory headers are enough
+        headers_left = {"A": 1, "B": 2}
+        headers_right = {"B": 3, "C": 4}
+        assert merge_headers(headers_left, headers_right, how=how) == expected
+
+    def test_headers_merging_left(self, _dframe_x, _dframe_y):
+        headers_left = _dframe_x.headers
+        headers_right = _dframe_y.headers
+        result = merge_headers(headers_left, headers_right, how="left")
 
         assert isinstance(result, dict)
         assert len(result) >= len(headers_left)  # no key disappeared
         assert len(result) >= len(headers_right)  # no key disappeared
-        for key in result:  # check that we prioritized headers_left's contents
-            if key in headers_left and key in headers_right:
-                assert result[key] == headers_left[key]
+        common_keys = headers_left.keys() & headers_right.keys()  # check that we prioritized headers_left's contents
+        assert_dict_equal({key: result[key] for key in common_keys}, {key: headers_left[key] for key in common_keys})
 
-    @pytest.mark.parametrize("how", ["right", "RIGHT", "Right", "RigHt"])  # we're case-insensitive
-    def test_headers_merging_right(self, _tfs_filex, _tfs_filey, how):
-        headers_left = tfs.read(_tfs_filex).headers
-        headers_right = tfs.read(_tfs_filey).headers
-        result = merge_headers(headers_left, headers_right, how=how)
+    def test_headers_merging_right(self, _dframe_x, _dframe_y):
+        headers_left = _dframe_x.headers
+        headers_right = _dframe_y.headers
+        result = merge_headers(headers_left, headers_right, how="right")
 
         assert isinstance(result, dict)
         assert len(result) >= len(headers_left)  # no key disappeared
         assert len(result) >= len(headers_right)  # no key disappeared
-        for key in result:  # check that we prioritized headers_right's contents
-            if key in headers_left and key in headers_right:
-                assert result[key] == headers_right[key]
-
-    @pytest.mark.parametrize("how", [None, "none", "None", "nOnE"])  # we're case-insensitive
-    def test_headers_merging_none_returns_empty_dict(self, _tfs_filex, _tfs_filey, how):
-        headers_left = tfs.read(_tfs_filex).headers
-        headers_right = tfs.read(_tfs_filey).headers
-        result = merge_headers(headers_left, headers_right, how=how)
+        common_keys = headers_left.keys() & headers_right.keys()  # check that we prioritized headers_right's contents
+        assert_dict_equal({key: result[key] for key in common_keys}, {key: headers_right[key] for key in common_keys})
+
+    def test_headers_merging_none_returns_empty_dict(self, _dframe_x, _dframe_y):
+        headers_left = _dframe_x.headers
+        headers_right = _dframe_y.headers
+        result = merge_headers(headers_left, headers_right, how=None)
         assert result == {}  # giving None returns empty headers
 
-    def test_providing_new_headers_overrides_merging(self, _tfs_filex, _tfs_filey):
-        dframe_x = tfs.read(_tfs_filex)
-        dframe_y = tfs.read(_tfs_filey)
+    def test_providing_new_headers_overrides_merging(self, _dframe_x, _dframe_y):
+        dframe_x = _dframe_x
+        dframe_y = _dframe_y
 
         assert dframe_x.merge(right=dframe_y, new_headers={}).headers == {}
         assert dframe_y.merge(right=dframe_x, new_headers={}).headers == {}
@@ -127,6 +163,16 @@ class TestHeadersPrinting:
         assert not all(str(val) in print_out for val in headers.values())
         assert "..." in print_out
 
+    def test_long_mapping_headers_print(self):
+        headers = MappingProxyType({f"p{i}": i for i in range(1, 9)})  # not a dict
+        df = TfsDataFrame(headers=headers)
+        print_out = repr(df)
+
+        assert all(f"p{i}: {i}" in print_out for i in (1, 2, 3, 6, 7, 8))
+        assert "p4" not in print_out
+        assert "p5" not in print_out
+        assert "..." in print_out
+
     def test_empty_headers_print(self):
         print_tfs = str(TfsDataFrame())
         print_df = str(pd.DataFrame())
@@ -134,33 +180,41 @@ class TestHeadersPrinting:
 
 
 class TestTfsDataFramesConcatenating:
+    # Headers merging does not depend on the data concatenation, so we
+    # check each with its own parametrization instead of their full product
+
     @pytest.mark.parametrize("how_headers", [None, "left", "right"])
-    @pytest.mark.parametrize("axis", [0, 1])
-    @pytest.mark.parametrize("join", ["inner", "outer"])
-    def test_correct_concatenating(self, _tfs_filex, _tfs_filey, how_headers, axis, join):
-        dframe_x = tfs.read(_tfs_filex)
-        dframe_y = tfs.read(_tfs_filey)
+    def test_correct_headers_concatenating(self, _dframe_x, _dframe_y, how_headers):
+        dframe_x = _dframe_x
+        dframe_y = _dframe_y
         objs = [dframe_x] * 4 + [dframe_y] * 4
-        result = concat(objs, how_headers=how_headers, axis=axis, join=join)
+        result = concat(objs, how_headers=how_headers)
 
         merger = partial(merge_headers, how=how_headers)
         all_headers = (tfsdframe.headers for tfsdframe in objs)
         assert isinstance(result, TfsDataFrame)
         assert isinstance(result.headers, dict)
         assert_dict_equal(result.headers, reduce(merger, all_headers))
-        assert_frame_equal(result, pd.concat(objs, axis=axis, join=join))
 
-    @pytest.mark.parametrize("how_headers", [None, "left", "right"])
     @pytest.mark.parametrize("axis", [0, 1])
     @pytest.mark.parametrize("join", ["inner", "outer"])
-    def test_concatenating_accepts_pandas_dataframes(self, _tfs_filex, _tfs_filey, how_headers, axis, join):
-        dframe_x = tfs.read(_tfs_filex)
-        dframe_y = pd.DataFrame(tfs.read(_tfs_filey))  # for test, loses headers here
+    def test_correct_concatenating(self, _dframe_x, _dframe_y, _reference_concat, axis, join):
+        dframe_x = _dframe_x
+        dframe_y = _dframe_y
+        objs = [dframe_x] * 4 + [dframe_y] * 4
+        result = concat(objs, axis=axis, join=join)
+
+        assert isinstance(result, TfsDataFrame)
+        assert_frame_equal(result, _reference_concat(axis, join))
+
+    @pytest.mark.parametrize("how_headers", [None, "left", "right"])
+    def test_headers_concatenating_accepts_pandas_dataframes(self, _dframe_x, _pd_dframe_y, how_headers):
+        dframe_x = _dframe_x
+        dframe_y = _pd_dframe_y  # for test, has no headers
         objs = [dframe_x] * 4 + [dframe_y] * 4  # now has a mix of TfsDataFrames and pandas.DataFrames
-        result = concat(objs, how_headers=how_headers, axis=axis, join=join)
+        result = concat(objs, how_headers=how_headers)
 
         merger = partial(merge_headers, how=how_headers)
-        # all_headers = (tfsdframe.headers for tfsdframe in objs)
         assert isinstance(result, TfsDataFrame)
         assert isinstance(result.headers, dict)
 
@@ -168,4 +222,63 @@ class TestTfsDataFramesConcatenating:
             dframe.headers if isinstance(dframe, TfsDataFrame) else {} for dframe in objs
         ]
         assert_dict_equal(result.headers, reduce(merger, all_headers))
-        assert_frame_equal(result, pd.concat(objs, axis=axis, join=join))
+
+    @pytest.mark.parametrize("axis", [0, 1])
+    @pytest.mark.parametrize("join", ["inner", "outer"])
+    def test_concatenating_accepts_pandas_dataframes(self, _dframe_x, _pd_dframe_y, _reference_concat, axis, join):
+        dframe_x = _dframe_x
+        dframe_y = _pd_dframe_y  # for test, has no headers
+        objs = [dframe_x] * 4 + [dframe_y] * 4  # now has a mix of TfsDataFrames and pandas.DataFrames
+        result = concat(objs, axis=axis, join=join)
+
+        assert isinstance(result, TfsDataFrame)
+        assert_frame_equal(result, _reference_concat(axis, join))
+
+
+# ----- Helpers & Fixtures ----- #
+
+# The parsed _dframe_x and _dframe_y come from conftest.py, and the dataframes
+# below are also built once for the whole session: none of the tests modify
+# them (merging and concatenating create new ones)
+
+
+@pytest.fixture(scope="session")
+def _pd_dframe_y(_dframe_y) -> pd.DataFrame:
+    """Same as _dframe_y but as a pandas.DataFrame, so without headers."""
+    return pd.DataFrame(_dframe_y)
+
+
+@pytest.fixture(scope="session")
+def _pd_dframe_x(_dframe_x) -> pd.DataFrame:
+    """Same as _dframe_x but as a pandas.DataFrame, so without headers."""
+    return pd.DataFrame(_dframe_x)
+
+
+@pytest.fixture(scope="session")
+def _reference_merge(_pd_dframe_x, _pd_dframe_y) -> Callable[[str, str], pd.DataFrame]:
+    """
+    Returns a function giving the expected result of merging file_x and file_y with
+    pandas, for given 'how' and 'on' arguments. Results are computed only once per
+    combination and shared by all merging tests.
+    """
+
+    @cache
+    def _merge(how: str, on: str) -> pd.DataFrame:
+        return _pd_dframe_x.merge(_pd_dframe_y, how=how, on=on)
+
+    return _merge
+
+
+@pytest.fixture(scope="session")
+def _reference_concat(_pd_dframe_x, _pd_dframe_y) -> Callable[[int, str], pd.DataFrame]:
+    """
+    Returns a function giving the expected result of concatenating file_x and file_y
+    (4 times each) with pandas, for given 'axis' and 'join' arguments. Results are
+    computed only once per combination and shared by all concatenating tests.
+    """
+
+    @cache
+    def _concat(axis: int, join: str) -> pd.DataFrame:
+        return pd.concat([_pd_dframe_x] * 4 + [_pd_dframe_y] * 4, axis=axis, join=join)
+
+    return _concat
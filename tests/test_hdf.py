@@ -29,31 +29,18 @@ class TestHDF:
         df_read = read_hdf(out_file)
         assert_tfs_frame_equal(original, df_read)
 
-    def test_write_empty_header(self, tmp_path: Path, _tfs_dataframe: TfsDataFrame):
-        """Test writing a TfsDataFrame with empty headers."""
-        _tfs_dataframe.headers = {}
-        out_file = tmp_path / "data_frame.h5"
-        write_hdf(out_file, _tfs_dataframe)
-
-        assert out_file.is_file()
-
-        df_read = read_hdf(out_file)
-        assert_tfs_frame_equal(_tfs_dataframe, df_read)
-
-    def test_write_empty_data(self, tmp_path: Path, _tfs_dataframe: TfsDataFrame):
-        """Test writing a TfsDataFrame with empty data."""
-        _tfs_dataframe = TfsDataFrame(headers=_tfs_dataframe.headers)
-        out_file = tmp_path / "data_frame.h5"
-        write_hdf(out_file, _tfs_dataframe)
-
-        assert out_file.is_file()
-
-        df_read = read_hdf(out_file)
-        assert_tfs_frame_equal(_tfs_dataframe, df_read)
-
-    def test_write_empty_frame(self, tmp_path: Path):
-        """Test writing an empty TfsDataFrame."""
-        _tfs_dataframe = TfsDataFrame()
+    @pytest.mark.parametrize(
+        "make_dataframe",
+        [
+            lambda df: TfsDataFrame(df, headers={}),
+            lambda df: TfsDataFrame(headers=df.headers),
+            lambda df: TfsDataFrame(),
+        ],
+        ids=["empty_headers", "empty_data", "empty_frame"],
+    )
+    def test_write_empty(self, tmp_path: Path, _tfs_dataframe: TfsDataFrame, make_dataframe):
+        """Test writing a TfsDataFrame with empty headers, empty data or both."""
+        _tfs_dataframe = make_dataframe(_tfs_dataframe)
         out_file = tmp_path / "data_frame.h5"
         write_hdf(out_file, _tfs_dataframe)
 
@@ -62,12 +49,12 @@ class TestHDF:
         df_read = read_hdf(out_file)
         assert_tfs_frame_equal(_tfs_dataframe, df_read)
 
+    @pytest.mark.slow
     def test_write_compression(self, tmp_path: Path):
         """Test that compression works and compressed files are readable."""
-        n = 1000
-        _tfs_dataframe = TfsDataFrame(
-            data=np.zeros([n, n]), headers={"Random": "Data"}
-        )  # highly compressible data
+        # highly compressible data, as few columns as possible since
+        # the frames comparison below goes column by column
+        _tfs_dataframe = TfsDataFrame(data=np.zeros([100_000, 10]), headers={"Random": "Data"})
 
         out_file = tmp_path / "data_frame.h5"
         write_hdf(out_file, _tfs_dataframe, complevel=0)
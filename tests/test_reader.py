@@ -1,4 +1,5 @@
 import pathlib
+import shlex
 
 import pytest
 from pandas.api import types as pdtypes
@@ -16,8 +17,9 @@ from .conftest import INPUTS_DIR
 
 
 class TestRead:
-    def test_tfs_read_pathlib_input(self, _tfs_filex: pathlib.Path):
-        test_file = read_tfs(_tfs_filex, index="NAME")
+    @pytest.mark.parametrize("as_str", [False, True], ids=["pathlib", "str"])
+    def test_tfs_read_path_input(self, _tfs_filex: pathlib.Path, as_str):
+        test_file = read_tfs(str(_tfs_filex) if as_str else _tfs_filex, index="NAME")
         assert len(test_file.headers) > 0
         assert len(test_file.columns) > 0
         assert len(test_file.index) > 0
@@ -30,14 +32,6 @@ class TestRead:
         with pytest.raises(KeyError):
             _ = test_file["Not_HERE"]
 
-    def test_tfs_read_str_input(self, _tfs_file_str: str):
-        test_file = read_tfs(_tfs_file_str, index="NAME")
-        assert len(test_file.headers) > 0
-        assert len(test_file.columns) > 0
-        assert len(test_file.index) > 0
-        assert len(str(test_file)) > 0
-        assert isinstance(test_file.index[0], str)
-
     def test_tfs_read_no_validation(self, _tfs_filex: pathlib.Path):
         test_file = read_tfs(_tfs_filex, index="NAME")
         assert len(test_file.headers) > 0
@@ -62,6 +56,21 @@ class TestRead:
         madx_str_id = "%20s"
         assert tfs.reader._id_to_type(madx_str_id) is str  # noqa: SLF001
 
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "* NAME S NUMBER CO CORMS BPM_RES",
+            "$ %s %le %d %le %le %le",
+            "@ Q1 %le 0.269974877952",
+            '@ TITLE %s "Title with spaces"',
+            "@ FiDeL model parameters updated  %08s    15/12/21",
+            "* NAME\xa0X S\u2003Y",
+            "@ TITLE %s ab\x0bcd\x1ce",
+        ],
+    )
+    def test_split_line_same_as_shlex(self, line):
+        assert tfs.reader._split_line(line) == shlex.split(line)  # noqa: SLF001
+
     def test_tfs_read_write_read_pathlib_input(self, _tfs_filex: pathlib.Path, tmp_path):
         original = read_tfs(_tfs_filex)
         write_location = tmp_path / "test_file.tfs"
@@ -71,18 +80,18 @@ class TestRead:
 
     def test_read_write_wise_header(self, _tfs_file_wise, tmp_path):
         original_text = _tfs_file_wise.read_text()
-        original_header_lines = [line for line in original_text.splitlines() if line.strip().startswith(HEADER)]
+        original_header_count = sum(1 for line in original_text.splitlines() if line.strip().startswith(HEADER))
         df = read_tfs(_tfs_file_wise)
 
-        assert len(df.headers) == len(original_header_lines)
+        assert len(df.headers) == original_header_count
 
         out_path = tmp_path / "wise_test.tfs"
         write_tfs(out_path, df)
 
         new_text = out_path.read_text()
-        new_header_lines = [line for line in new_text.splitlines() if line.strip().startswith(HEADER)]
+        new_header_count = sum(1 for line in new_text.splitlines() if line.strip().startswith(HEADER))
 
-        assert len(new_header_lines) == len(original_header_lines)
+        assert new_header_count == original_header_count
 
         for header, value in df.headers.items():
             assert header in new_text
@@ -93,7 +102,7 @@ class TestRead:
         assert isinstance(headers, dict)
         assert len(headers) > 0
         assert len(str(headers)) > 0
-        assert all(key in headers for key in ["TITLE", "DPP", "Q1", "Q1RMS", "NATQ1", "NATQ1RMS", "BPMCOUNT"])
+        assert {"TITLE", "DPP", "Q1", "Q1RMS", "NATQ1", "NATQ1RMS", "BPMCOUNT"} <= headers.keys()
 
     def test_read_empty_strings_ok(self, _empty_strings_tfs_path):
         df = read_tfs(_empty_strings_tfs_path)
@@ -101,39 +110,39 @@ class TestRead:
         # Make sure the NAME column is properly inferred to string dtype
         assert isinstance(df.convert_dtypes().NAME.dtype, StringDtype)
         # Make sure there are no nans in the NAME column
-        assert not any(df.NAME.isna())
+        assert not df.NAME.isna().any()
         # Make sure we have exactly 5 empty strings in the NAME column
-        assert sum(df.NAME == "") == 5
+        assert (df.NAME == "").sum() == 5
 
-    def test_read_file_with_empty_lines_in_header(self, _tfs_file_empty_lines, _tfs_filex):
+    def test_read_file_with_empty_lines_in_header(self, _tfs_file_empty_lines, _dframe_x):
         df = read_tfs(_tfs_file_empty_lines)
         assert df.headers
-        df_for_compare = read_tfs(_tfs_filex)
+        df_for_compare = _dframe_x
         assert_tfs_frame_equal(df, df_for_compare)
 
-    def test_read_file_single_header_empty_line_in_header(self, _tfs_file_single_header_empty_line, _tfs_filex):
+    def test_read_file_single_header_empty_line_in_header(self, _tfs_file_single_header_empty_line, _dframe_x):
         """Very special, but this was a case that failed in the past."""
         df = read_tfs(_tfs_file_single_header_empty_line)
         assert len(df.headers) == 1
-        df_for_compare = read_tfs(_tfs_filex)
+        df_for_compare = _dframe_x
         assert_frame_equal(df, df_for_compare)  # no headers, just check dframe
 
-    def test_read_file_without_header_empty_line(self, _tfs_file_without_header_but_empty_line, _tfs_filex):
+    def test_read_file_without_header_empty_line(self, _tfs_file_without_header_but_empty_line, _dframe_x):
         df = read_tfs(_tfs_file_without_header_but_empty_line)
         assert not df.headers
-        df_for_compare = read_tfs(_tfs_filex)
+        df_for_compare = _dframe_x
         assert_frame_equal(df, df_for_compare)  # no headers, just check dframe
 
-    def test_read_file_with_whitespaces_in_header(self, _tfs_file_with_whitespaces, _tfs_filex):
+    def test_read_file_with_whitespaces_in_header(self, _tfs_file_with_whitespaces, _dframe_x):
         df = read_tfs(_tfs_file_with_whitespaces)
         assert df.headers
-        df_for_compare = read_tfs(_tfs_filex)
+        df_for_compare = _dframe_x
         assert_tfs_frame_equal(df, df_for_compare)
 
-    def test_read_file_without_header(self, _tfs_file_without_header, _tfs_filex):
+    def test_read_file_without_header(self, _tfs_file_without_header, _dframe_x):
         df = read_tfs(_tfs_file_without_header)
         assert not df.headers
-        df_for_compare = read_tfs(_tfs_filex)
+        df_for_compare = _dframe_x
         assert_frame_equal(df, df_for_compare)  # no headers, just check dframe
 
     # ----- Below are tests for files with MAD-NG features ----- #
@@ -253,56 +262,56 @@ class TestFailures:
 # ----- Helpers & Fixtures ----- #
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_str(_tfs_filex) -> str:
     return str(_tfs_filex.absolute())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _no_coltypes_tfs_path() -> pathlib.Path:
     return INPUTS_DIR / "no_coltypes.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _no_colnames_tfs_path() -> pathlib.Path:
     return INPUTS_DIR / "no_colnames.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _space_in_colnames_tfs_path() -> pathlib.Path:
     return INPUTS_DIR / "space_in_colname.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_wise() -> pathlib.Path:
     return INPUTS_DIR / "wise_header.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_empty_lines() -> pathlib.Path:
     return INPUTS_DIR / "empty_lines_in_header.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_single_header_empty_line() -> pathlib.Path:
     return INPUTS_DIR / "single_header_line_and_empty_line.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_with_whitespaces() -> pathlib.Path:
     return INPUTS_DIR / "line_with_whitespaces_in_header.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_without_header() -> pathlib.Path:
     return INPUTS_DIR / "no_header.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _tfs_file_without_header_but_empty_line() -> pathlib.Path:
     return INPUTS_DIR / "no_header_just_an_empty_line.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _empty_strings_tfs_path() -> pathlib.Path:
     return INPUTS_DIR / "empty_strings.tfs"
@@ -72,11 +72,11 @@ def test_significant_digits():
 # ----- Helpers & Fixtures ----- #
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _bad_file_pathlib() -> pathlib.Path:
     return INPUTS_DIR / "bad_file.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _bad_file_str(_bad_file_pathlib) -> str:
     return str(_bad_file_pathlib.absolute())
@@ -184,12 +184,12 @@ class TestMADNGValidation:
 # ------ Fixtures ------ #
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _space_in_colnames_tfs_path() -> pathlib.Path:
     return INPUTS_DIR / "space_in_colname.tfs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def _invalid_bool_in_header_tfs_file() -> pathlib.Path:
     """TFS file with invalid value for bool header."""
     return INPUTS_DIR / "invalid_bool_header.tfs"
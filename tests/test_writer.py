@@ -1,5 +1,4 @@
 import logging
-import random
 import string
 import sys
 
@@ -21,13 +20,15 @@ from tfs.errors import (
 )
 from tfs.testing import assert_tfs_frame_equal
 
+from .conftest import RNG_SEED
+
 
 class TestWrites:
     def test_tfs_write_empty_columns_dataframe(self, tmp_path):
         df = TfsDataFrame(
             index=range(3),
             columns=[],
-            data=np.random.rand(3, 0),
+            data=np.empty((3, 0)),
             headers={"Title": "Tfs Title", "Value": 3.3663},
         )
 
@@ -53,6 +54,7 @@ class TestWrites:
         assert_series_equal(df, new["0"], check_names=False)
         assert_dict_equal(test_headers, new.headers, compare_keys=True)
 
+    @pytest.mark.slow
     def test_madx_reads_written_tfsdataframes(self, _bigger_tfs_dataframe, tmp_path):
         dframe = _bigger_tfs_dataframe
         dframe.headers["TYPE"] = "TWISS"  # MAD-X complains on TFS files with no "TYPE" header
@@ -76,7 +78,7 @@ class TestWrites:
         df = TfsDataFrame(
             index=[],
             columns=["a", "b", "c"],
-            data=np.random.rand(0, 3),
+            data=np.empty((0, 3)),
             headers={"Title": "Tfs Title", "Value": 3.3663},
         )
 
@@ -383,20 +385,22 @@ class TestFailures:
 
 @pytest.fixture
 def _bigger_tfs_dataframe() -> TfsDataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     return TfsDataFrame(
         index=range(50),
         columns=list(string.ascii_lowercase),
-        data=np.random.rand(50, len(list(string.ascii_lowercase))),
+        data=rng.random((50, len(string.ascii_lowercase))),
         headers={"Title": "Tfs Title", "Value": 3.3663},
     )
 
 
 @pytest.fixture
 def _dataframe_empty_headers() -> TfsDataFrame:
+    rng = np.random.default_rng(RNG_SEED)
     return TfsDataFrame(
         index=range(3),
         columns="a b c d e".split(),
-        data=np.random.rand(3, 5),
+        data=rng.random((3, 5)),
         headers={},
     )
 
@@ -404,9 +408,10 @@ def _dataframe_empty_headers() -> TfsDataFrame:
 @pytest.fixture
 def _messed_up_dataframe() -> TfsDataFrame:
     """Returns a TfsDataFrame with mixed types in each column, some elements being lists."""
-    int_row = np.array([random.randint(int(-1e5), int(1e5)) for _ in range(4)], dtype=np.float64)
-    float_row = np.array([round(random.uniform(-1e5, 1e5), 7) for _ in range(4)], dtype=np.float64)
-    string_row = np.array([_rand_string() for _ in range(4)], dtype=str)
+    rng = np.random.default_rng(RNG_SEED)
+    int_row = np.array(_rand_ints(rng, 4), dtype=np.float64)
+    float_row = np.array(_rand_floats(rng, 4), dtype=np.float64)
+    string_row = np.array([_rand_string(rng) for _ in range(4)], dtype=str)
     list_floats_row = [[1.0, 14.777], [2.0, 1243.9], [3.0], [123414.0, 9909.12795]]
     return TfsDataFrame(
         index=range(4),
@@ -419,9 +424,10 @@ def _messed_up_dataframe() -> TfsDataFrame:
 @pytest.fixture
 def _dict_column_in_dataframe() -> TfsDataFrame:
     """Returns a TfsDataFrame with a column having dictionaries as elements."""
-    int_elements = [random.randint(int(-1e5), int(1e5)) for _ in range(4)]
-    float_elements = [round(random.uniform(-1e5, 1e5), 7) for _ in range(4)]
-    string_elements = [_rand_string() for _ in range(4)]
+    rng = np.random.default_rng(RNG_SEED)
+    int_elements = _rand_ints(rng, 4)
+    float_elements = _rand_floats(rng, 4)
+    string_elements = [_rand_string(rng) for _ in range(4)]
     dict_elements = [{"a": "dict"}, {"b": 14}, {"c": 444.12}, {"d": [1, 2]}]
     data = [[e[i] for e in (int_elements, float_elements, string_elements, dict_elements)] for i in range(4)]
     return TfsDataFrame(
@@ -435,9 +441,10 @@ def _dict_column_in_dataframe() -> TfsDataFrame:
 @pytest.fixture
 def _list_column_in_dataframe() -> TfsDataFrame:
     """Returns a TfsDataFrame with a column having lists as elements."""
-    int_elements = [random.randint(int(-1e5), int(1e5)) for _ in range(4)]
-    float_elements = [round(random.uniform(-1e5, 1e5), 7) for _ in range(4)]
-    string_elements = [_rand_string() for _ in range(4)]
+    rng = np.random.default_rng(RNG_SEED)
+    int_elements = _rand_ints(rng, 4)
+    float_elements = _rand_floats(rng, 4)
+    string_elements = [_rand_string(rng) for _ in range(4)]
     list_elements = [[1.0, 14.777], [2.0, 1243.9], [3.0], [123414.0, 9909.12795]]
     data = [[e[i] for e in (int_elements, float_elements, string_elements, list_elements)] for i in range(4)]
     return TfsDataFrame(
@@ -448,5 +455,13 @@ def _list_column_in_dataframe() -> TfsDataFrame:
     )
 
 
-def _rand_string(string_length: int = 10) -> str:
-    return "".join(random.choice(string.ascii_letters) for _ in range(string_length))
+def _rand_ints(rng: np.random.Generator, size: int) -> list[int]:
+    return [int(value) for value in rng.integers(int(-1e5), int(1e5), size=size, endpoint=True)]
+
+
+def _rand_floats(rng: np.random.Generator, size: int) -> list[float]:
+    return [round(float(value), 7) for value in rng.uniform(-1e5, 1e5, size=size)]
+
+
+def _rand_string(rng: np.random.Generator, string_length: int = 10) -> str:
+    return "".join(rng.choice(list(string.ascii_letters), size=string_length))
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import pathlib
+import re
 import shlex
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -52,6 +53,10 @@ LOGGER = logging.getLogger(__name__)
 _NA_VALUES: list[str] = [*list(STR_NA_VALUES), "nil"]
 _NA_VALUES.remove("")
 
+# Lines for which 'shlex' does more than splitting on whitespace: quotes and escapes, or
+# whitespaces other than space and tab, on which 'str.split' would split but 'shlex' not
+_SHLEX_SPECIAL_CHARACTERS: re.Pattern = re.compile(r"[\"'\\]|[^\S \t]")
+
 # ----- Main Functionality ----- #
 
 def read_tfs(
@@ -315,13 +320,16 @@ def _read_metadata(tfs_file_path: pathlib.Path | str) -> _TfsMetaData:
     headers = {}
 
     # Note: the helper contextmanager handles compression for us
-    # and provides and handle to iterate through, line by line
+    # and provides and handle to iterate through, line by line.
+    # We iterate on the handle directly (and not on its .readlines())
+    # so that the (potentially decompressed) file is streamed and only
+    # read until the first data line, not loaded entirely in memory
     with _metadata_handle(tfs_file_path) as file_reader:
-        for line_number, line in enumerate(file_reader.readlines()):
+        for line_number, line in enumerate(file_reader):
             stripped_line = line.strip()
             if not stripped_line:
                 continue  # empty line
-            line_components = shlex.split(stripped_line)
+            line_components = _split_line(stripped_line)
             if line_components[0] == HEADER:
                 name, value = _parse_header_line(line_components[1:])
                 headers[name] = value
@@ -344,6 +352,25 @@ def _read_metadata(tfs_file_path: pathlib.Path | str) -> _TfsMetaData:
     )
 
 
+def _split_line(line: str) -> list[str]:
+    """
+    Splits a (stripped) line of the file into its components. Elements enclosed in
+    quotes are kept together, for which we rely on ``shlex.split``. As this is quite
+    slow, lines without any quote or escape character and without whitespaces other
+    than spaces and tabs (such as the column names and types lines, or most numeric
+    header lines) are simply split on whitespaces.
+
+    Args:
+        line (str): the line to split, stripped of leading and trailing whitespaces.
+
+    Returns:
+        A list of the components of the line.
+    """
+    if _SHLEX_SPECIAL_CHARACTERS.search(line):
+        return shlex.split(line)
+    return line.split()
+
+
 
 def _parse_header_line(str_list: list[str]) -> tuple[str, bool | str | int | float, np.complex128]:
     """
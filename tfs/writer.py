@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import pathlib
 import string
+from itertools import repeat
 from types import NoneType
 
 import numpy as np
@@ -257,24 +258,50 @@ def _get_data_string(
     if len(data_frame.index) == 0 or len(data_frame.columns) == 0:
         return "\n"
 
-    format_strings = "  " + _get_row_format_string(data_frame.dtypes, colwidth, left_align_first_column)
+    format_specs = _get_column_format_specs(data_frame.dtypes, colwidth, left_align_first_column)
     data_frame = data_frame.astype(object)  # overrides pandas auto-conversion (lead to format bug)
     string_formatter = ValueToStringFormatter()
 
-    # A bit ugly but we go line per line and determine the string on the fly
-    return "\n".join(
-        data_frame.apply(lambda series: string_formatter.format(format_strings, *series), axis=1)
-    )
+    # Each column is formatted at once and the lines are assembled at the end: it avoids
+    # parsing a full row format string for every line, and lets plain numeric values
+    # go straight to the builtin format (only our special cases need the formatter)
+    formatted_columns = [
+        _format_column(data_frame.iloc[:, indx].tolist(), format_spec, string_formatter)
+        for indx, format_spec in enumerate(format_specs)
+    ]
+    return "\n".join("  " + " ".join(row_strings) for row_strings in zip(*formatted_columns))
+
+
+def _get_column_format_specs(
+    dtypes: list[type], colwidth: int, left_align_first_column: bool  # noqa: FBT001
+) -> list[str]:
+    """
+    Returns the format specifiers (for fstrings) of each column of the data part of the
+    dataframe, based on the dtypes of the columns and the column width to use for writing.
+    For instance: [">20s", ">20.12g", ">20d", ">20.12g"].
+
+    Args:
+        dtypes (list): list of the dtypes of the columns.
+        colwidth (int): column width to use when formatting the row.
+        left_align_first_column (bool): whether to left-align the first column or not.
+
+    Returns:
+        The list of format specifiers, one per column.
+    """
+    return [
+        f"{'<' if (not indx) and left_align_first_column else '>'}{_dtype_to_formatter_string(type_, colwidth)}"
+        for indx, type_ in enumerate(dtypes)
+    ]
 
 
 def _get_row_format_string(
     dtypes: list[type], colwidth: int, left_align_first_column: bool  # noqa: FBT001
 ) -> str:
     """
-    Returns the formatter string for a given row of the data part of the dataframe,
-    based on the dtypes of the columns and the column width to use for writing. It is
-    a string with the formatting speficiers (for fstrings), one slot per column. For
-    instance: {0:>20s} {1:>20.12g} {2:>20d} {3:>20.12g}".
+    Returns the formatter string for a given row of the dataframe, based on the dtypes
+    of the columns and the column width to use for writing. It is a string with the
+    formatting speficiers (for fstrings), one slot per column. For instance:
+    "{0:>20s} {1:>20.12g} {2:>20d} {3:>20.12g}".
 
     Args:
         dtypes (list): list of the dtypes of the columns.
@@ -282,14 +309,21 @@ def _get_row_format_string(
         left_align_first_column (bool): whether to left-align the first column or not.
 
     Returns:
-        The full formatter string for any data row.
+        The full formatter string for any row.
     """
-    return " ".join(
-        f"{{{indx:d}:"
-        f"{'<' if (not indx) and left_align_first_column else '>'}"
-        f"{_dtype_to_formatter_string(type_, colwidth)}}}"
-        for indx, type_ in enumerate(dtypes)
-    )
+    format_specs = _get_column_format_specs(dtypes, colwidth, left_align_first_column)
+    return " ".join(f"{{{indx:d}:{format_spec}}}" for indx, format_spec in enumerate(format_specs))
+
+
+def _format_column(values: list, format_spec: str, string_formatter: ValueToStringFormatter) -> list[str]:
+    """
+    Returns the formatted strings of all values of a column, according to
+    the provided format specifier. Booleans, complex numbers and strings go
+    through our own formatter, other values through the builtin format.
+    """
+    if format_spec.endswith(("b", "c", "s")):
+        return list(map(string_formatter.format_field, values, repeat(format_spec)))
+    return list(map(format, values, repeat(format_spec)))
 
 
 def _value_to_tfs_type_identifier(value) -> str: